@@ -0,0 +1,70 @@
+"""Measures the event loop lag caused by logging under heavy load.
+
+Compares the synchronous `log` against the `alog` asyncio logger,
+with a JSON structural logger attached.
+
+$ python benchmarks/async_event_loop_lag.py
+"""
+
+import asyncio
+import contextlib
+import io
+import os
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault("APPDATA", tempfile.gettempdir())
+os.chdir(tempfile.mkdtemp())
+
+from logit import OutputFormat, alog, log  # noqa: E402
+
+N_LOGS = 2000
+TICK = 0.001
+
+
+async def _heartbeat(lags: list[float], stop: asyncio.Event) -> None:
+    """Records how late the event loop wakes up after each tick."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def _run(logger) -> list[float]:
+    lags = []
+    stop = asyncio.Event()
+    heartbeat = asyncio.create_task(_heartbeat(lags, stop))
+
+    for i in range(N_LOGS):
+        logger.info(f"Handled request {i}")
+        if i % 50 == 0:
+            await asyncio.sleep(0)
+
+    if logger is alog:
+        await alog.aflush()
+    stop.set()
+    await heartbeat
+
+    return lags
+
+
+def main() -> None:
+    log.add_structural_logger(OutputFormat.JSON)
+
+    for name, logger in (("sync log", log), ("alog", alog)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            lags = asyncio.run(_run(logger))
+            elapsed = time.perf_counter() - start
+
+        print(
+            f"{name:>8}: {N_LOGS} logs in {elapsed:.2f}s | "
+            f"loop lag max {max(lags) * 1000:.1f}ms, "
+            f"p50 {statistics.median(lags) * 1000:.2f}ms "
+            f"over {len(lags)} ticks"
+        )
+
+
+if __name__ == "__main__":
+    main()
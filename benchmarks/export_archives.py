@@ -0,0 +1,56 @@
+"""Measures converting a directory of XML archives to JSON Lines,
+serially and across a process pool.
+
+$ python benchmarks/export_archives.py
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("APPDATA", tempfile.gettempdir())
+os.chdir(tempfile.mkdtemp())
+
+from logit import OutputFormat  # noqa: E402
+from logit._export import export_files, find_log_files  # noqa: E402
+
+N_ARCHIVES = 300
+LOGS_PER_ARCHIVE = 2000
+
+
+def _create_archives(directory: Path) -> None:
+    log = (
+        "<log><msg>Handled request {i}</msg><level>[INFO]</level>"
+        "<line_number>app.py:{i}</line_number><local_time>13:18:35</local_time>"
+        "<request_id>{i:08x}</request_id></log>"
+    )
+    body = "".join(log.format(i=i) for i in range(LOGS_PER_ARCHIVE))
+    for n in range(N_ARCHIVES):
+        path = directory / f"2023-02-{n:03}-archive-structured-app.xml"
+        path.write_text(f"<data>{body}</data>")
+
+
+def main() -> None:
+    archives = Path("archives")
+    archives.mkdir()
+    _create_archives(archives)
+    sources = find_log_files([archives], OutputFormat.XML)
+    size = sum(source.stat().st_size for source in sources) / 1e6
+
+    for processes in (1, None):
+        start = time.perf_counter()
+        for _ in export_files(
+            sources, OutputFormat.XML, OutputFormat.JSONL, processes=processes
+        ):
+            pass
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"processes={processes or os.cpu_count()}: {len(sources)} archives "
+            f"({size:.0f} MB) in {elapsed:.2f}s, {size / elapsed:.1f} MB/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
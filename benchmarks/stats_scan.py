@@ -0,0 +1,51 @@
+"""Measures the scan speed of `logit stats` over text archives,
+without and with the saved indexes.
+
+$ python benchmarks/stats_scan.py
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("APPDATA", tempfile.gettempdir())
+os.chdir(tempfile.mkdtemp())
+
+from logit._stats import find_scannable_files, scan_files  # noqa: E402
+
+N_ARCHIVES = 20
+LOGS_PER_ARCHIVE = 100_000
+
+
+def _create_archives(directory: Path) -> None:
+    levels = ("INFO", "DEBUG", "WARNING", "ERROR")
+    body = "".join(
+        f"[{levels[i % 4]}] | handlers.py:{i % 97} | "
+        f"Handled request {i} in {i % 300}ms | 13:{i % 60}:{i % 60}\n"
+        for i in range(LOGS_PER_ARCHIVE)
+    )
+    for n in range(N_ARCHIVES):
+        (directory / f"2023-02-{n:02}-archive-app.log").write_text(body)
+
+
+def main() -> None:
+    archives = Path("archives")
+    archives.mkdir()
+    _create_archives(archives)
+    files = find_scannable_files([archives])
+    size = sum(file.stat().st_size for file in files) / 1e6
+
+    for label, use_index in (("scan", True), ("indexed", True)):
+        start = time.perf_counter()
+        stats = scan_files(files, use_index=use_index)
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"{label:>7}: {stats.total} records ({size:.0f} MB) in {elapsed:.2f}s, "
+            f"{size / elapsed:.1f} MB/s on {os.cpu_count()} CPUs"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,13 @@
+from ._async import AsyncLogger
+from ._context import (
+    bind_contextvars,
+    clear_contextvars,
+    get_contextvars,
+    reset_contextvars,
+    unbind_contextvars,
+)
 from ._enums import Level, OutputFormat
+from ._logger import BoundLogger
 from ._logger import Logger as _Logger
 from ._logger import StructualLogger
 from ._cli import CLI as _CLI
@@ -9,3 +18,4 @@ def _cli():
 
 
 log = _Logger()
+alog = AsyncLogger(log)
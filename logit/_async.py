@@ -0,0 +1,209 @@
+"""Contains the asyncio integration of logit.
+
+Logs made through the `AsyncLogger` are only captured on the event loop,
+they are written out in batches by a writer task which hands the actual
+I/O over to a dedicated thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import concurrent.futures
+import sys
+import threading
+import traceback
+import typing as _t
+import weakref
+
+from ._context import EMPTY_CONTEXT, Context
+from ._enums import Level
+from ._record import ExcInfo, LogRecord
+
+if _t.TYPE_CHECKING:
+    from ._logger import BoundLogger, Logger
+
+
+class _LoopWriter:
+    """The queue, writer task and thread of a single event loop.
+
+    Every event loop gets its own, so loops running on
+    different threads never touch each other's queue.
+    """
+
+    def __init__(
+        self, logger: Logger, loop: asyncio.AbstractEventLoop, batch_size: int
+    ) -> None:
+        self.logger = logger
+        self.batch_size = batch_size
+        self.queue: asyncio.Queue[LogRecord] = asyncio.Queue()
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="logit"
+        )
+        self.task = loop.create_task(self._write())
+        atexit.register(self.drain)
+
+    def drain(self) -> None:
+        """Synchronously writes out the records left behind in the queue."""
+        pending = []
+        while not self.queue.empty():
+            pending.append(self.queue.get_nowait())
+            self.queue.task_done()
+        if pending:
+            self.logger._output(pending)
+
+    def close(self) -> None:
+        """Waits for the batch being written, then writes out the rest."""
+        self.executor.shutdown()
+        self.drain()
+        atexit.unregister(self.drain)
+
+    async def _write(self) -> None:
+        """Writes out the queued records in batches."""
+        queue = self.queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                # Shielded so that a batch handed to the thread is always written
+                await asyncio.shield(
+                    loop.run_in_executor(self.executor, self.logger._output, batch)
+                )
+            except Exception:
+                # A failed batch must not stop the writer, the following
+                # batches are still written and `aflush` still returns.
+                print(
+                    f"logit: failed to write {len(batch)} logs",
+                    file=sys.stderr,
+                )
+                traceback.print_exc()
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+
+class AsyncLogger:
+    """A logger whose calls never block the event loop.
+
+    Shares the configuration, log file and structural loggers of the
+    wrapped `Logger`. Every event loop logging through it gets its own
+    writer. Outside of a running event loop, logs are written synchronously.
+
+    Example:
+        from logit import alog
+
+        async def main():
+            alog.info("Request handled")
+            await alog.aflush()
+    """
+
+    def __init__(self, logger: Logger, batch_size: int = 1000) -> None:
+        self.logger = logger
+        self.batch_size = batch_size
+        self._writers: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopWriter
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _log(
+        self,
+        level: Level,
+        msg: object = "",
+        context: Context = EMPTY_CONTEXT,
+        exc_info: bool | BaseException | ExcInfo | None = None,
+    ) -> None:
+        records = self.logger._capture(level, msg, context, exc_info)
+        if not records:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.logger._output(records)
+            return
+
+        queue = self._get_writer(loop).queue
+        for record in records:
+            queue.put_nowait(record)
+
+    def _get_writer(self, loop: asyncio.AbstractEventLoop) -> _LoopWriter:
+        """Gets the writer of the given event loop, starting it if needed."""
+        writer = self._writers.get(loop)
+        if writer is not None and not writer.task.done():
+            return writer
+
+        writer = _LoopWriter(self.logger, loop, self.batch_size)
+        with self._lock:
+            self._writers[loop] = writer
+        writer.task.add_done_callback(lambda _: self._close_writer(loop, writer))
+        return writer
+
+    def _close_writer(
+        self, loop: asyncio.AbstractEventLoop, writer: _LoopWriter
+    ) -> None:
+        """Closes the writer of an event loop once its task is done, such
+        as when the loop shuts down."""
+        writer.close()
+        with self._lock:
+            if self._writers.get(loop) is writer:
+                del self._writers[loop]
+
+    async def aflush(self) -> None:
+        """Waits until every record queued on this event loop has been written."""
+        writer = self._writers.get(asyncio.get_running_loop())
+        if writer is not None:
+            await writer.queue.join()
+
+    async def aclose(self) -> None:
+        """Flushes the queued records and stops the writer of this event loop."""
+        writer = self._writers.get(asyncio.get_running_loop())
+        if writer is None:
+            return
+
+        await writer.queue.join()
+        writer.task.cancel()
+        await asyncio.wait([writer.task])
+
+    def bind(self, **fields: object) -> BoundLogger:
+        """Creates a child logger that attaches the given fields to every log."""
+        from ._logger import BoundLogger
+
+        return BoundLogger(self, EMPTY_CONTEXT.new_child(fields))
+
+    def clutter(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self._log(Level.CLUTTER, msg, exc_info=exc_info)
+
+    def info(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self._log(Level.INFO, msg, exc_info=exc_info)
+
+    def debug(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self._log(Level.DEBUG, msg, exc_info=exc_info)
+
+    def warning(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self._log(Level.WARNING, msg, exc_info=exc_info)
+
+    def error(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self._log(Level.ERROR, msg, exc_info=exc_info)
+
+    def critical(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self._log(Level.CRITICAL, msg, exc_info=exc_info)
+
+    def exception(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = True
+    ) -> None:
+        self._log(Level.ERROR, msg, exc_info=exc_info)
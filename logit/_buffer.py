@@ -0,0 +1,67 @@
+"""Contains the in-memory ring buffer of recent log records."""
+
+from __future__ import annotations
+
+import threading
+
+from ._enums import Level
+from ._record import LogRecord
+
+# Sharded logs are merged by sorting them within a window of this many logs,
+# a ring buffer flush puts the logs of a shard at most its size out of order.
+MAX_SIZE = 10_000
+
+
+class RingBuffer:
+    """Holds the last `size` log records, of every level.
+
+    The slots are allocated upfront, so adding a record is only
+    an assignment, nothing is formatted until the buffer is dumped.
+    """
+
+    def __init__(self, size: int, flush_level: Level = Level.ERROR) -> None:
+        if size < 1:
+            raise ValueError(f"Ring buffer size must be positive, not {size}.")
+        if size > MAX_SIZE:
+            raise ValueError(
+                f"Ring buffer size must be at most {MAX_SIZE}, not {size}."
+            )
+
+        self.size = size
+        self.flush_level = flush_level
+        self.flush_rank = flush_level.get_level_value()
+        self._records: list[LogRecord | None] = [None] * size
+        self._index = 0
+        # Records are added from any thread, reentrant as
+        # a signal can dump the buffer mid append
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return sum(record is not None for record in self._records)
+
+    def append(self, record: LogRecord) -> None:
+        """Adds a record, overwriting the oldest one when full."""
+        with self._lock:
+            self._records[self._index] = record
+            self._index = (self._index + 1) % self.size
+
+    def dump(self, below_rank: int) -> list[LogRecord]:
+        """Empties the buffer.
+
+        Arguments:
+            below_rank: Only records ranked below this are returned,
+            which are the ones that were not already output.
+
+        Returns:
+            The records, oldest first.
+        """
+        with self._lock:
+            ordered = self._records[self._index :] + self._records[: self._index]
+            self._records = [None] * self.size
+            self._index = 0
+
+        return [
+            record
+            for record in ordered
+            if record is not None and record.level.get_level_value() < below_rank
+        ]
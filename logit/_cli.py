@@ -3,8 +3,16 @@ All CLI related operations are contained in this file.
 """
 
 import argparse
-from ._common import ARCHIVES_FOLDER
+import json
 import os
+import time
+from pathlib import Path
+
+from ._common import ARCHIVES_FOLDER
+from ._data import iter_merged_log_lines, iter_merged_logs
+from ._enums import OutputFormat
+from ._export import export_files, find_log_files
+from ._stats import find_scannable_files, format_summary, scan_files
 
 
 class CLI:
@@ -14,20 +22,102 @@ class CLI:
         self.parser = argparse.ArgumentParser(
             "logit", description="Handle the logs for your application."
         )
-        self.parser.add_argument(
+        subparsers = self.parser.add_subparsers(title="commands")
+
+        clear_archives_parser = subparsers.add_parser(
+            "clear-archives", help="Clears all archives for the project."
+        )
+        clear_archives_parser.add_argument(
             "directory",
             type=str,
+            nargs="?",
+            default=".",
             help="The project to handle.",
         )
-        self.parser.add_argument(
-            "--clear-archives",
-            action="store_const",
-            default=self.parser.print_help,
-            const=self.clear_archives,
-            help="Clears all archives for the project.",
+        clear_archives_parser.set_defaults(handler=self.clear_archives)
+
+        formats = [output_format.value for output_format in OutputFormat]
+        export_parser = subparsers.add_parser(
+            "export", help="Converts structured logs and archives to another format."
+        )
+        export_parser.add_argument(
+            "paths",
+            type=Path,
+            nargs="*",
+            default=[ARCHIVES_FOLDER],
+            help="The log files or directories to convert, the archives by default.",
+        )
+        export_parser.add_argument(
+            "--from", dest="from_format", required=True, choices=formats
+        )
+        export_parser.add_argument(
+            "--to", dest="to_format", required=True, choices=formats
+        )
+        export_parser.add_argument(
+            "--output-dir",
+            type=Path,
+            default=None,
+            help="Where to write the converted files, next to each file by default.",
+        )
+        export_parser.add_argument(
+            "--processes",
+            type=int,
+            default=None,
+            help="The number of files to convert in parallel, the CPU count by default.",
         )
+        export_parser.set_defaults(handler=self.export)
+
+        stats_parser = subparsers.add_parser(
+            "stats", help="Summarizes the logs and archives of the project."
+        )
+        stats_parser.add_argument(
+            "paths",
+            type=Path,
+            nargs="*",
+            help=(
+                "The log files or directories to scan, the text logs"
+                " of app.log and the archives by default."
+            ),
+        )
+        stats_parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Outputs the summary as JSON.",
+        )
+        stats_parser.add_argument(
+            "--top",
+            type=int,
+            default=10,
+            help="The number of call sites, templates and minutes to show.",
+        )
+        stats_parser.add_argument(
+            "--processes",
+            type=int,
+            default=None,
+            help="The number of files to scan in parallel, the CPU count by default.",
+        )
+        stats_parser.add_argument(
+            "--no-index",
+            dest="use_index",
+            action="store_false",
+            help="Scans every file, instead of reusing the stats of unchanged files.",
+        )
+        stats_parser.set_defaults(handler=self.stats)
+
+        merge_parser = subparsers.add_parser(
+            "merge", help="Outputs the shards of a log file as one stream, by time."
+        )
+        merge_parser.add_argument(
+            "log_file_path",
+            type=Path,
+            nargs="?",
+            default=Path("app.log"),
+            help="The log file or structured log file that was sharded.",
+        )
+        merge_parser.set_defaults(handler=self.merge)
 
         self.args = self.parser.parse_args()
+        getattr(self.args, "handler", self.parser.print_help)()
 
     def clear_archives(self) -> None:
         """
@@ -39,10 +129,82 @@ class CLI:
         Done ✅
         """
 
-        print(f"* Clearing all archives for {os.getcwd()}...")
+        project = Path(self.args.directory).absolute()
+        print(f"* Clearing all archives for {project}...")
 
-        for file in ARCHIVES_FOLDER.iterdir():
+        for file in (project / ARCHIVES_FOLDER).iterdir():
             print(f"* Removing {file.name}")
             os.remove(file)
 
         print("Done ✅")
+
+    def export(self) -> None:
+        """
+        $ logit export --from xml --to jsonl
+        * Exporting {n} xml files to jsonl...
+        * Wrote {exported-file-name}
+        ...
+
+        Done in {seconds}s ✅
+        """
+
+        from_format = OutputFormat(self.args.from_format)
+        to_format = OutputFormat(self.args.to_format)
+        sources = find_log_files(self.args.paths, from_format)
+        if self.args.output_dir is not None:
+            self.args.output_dir.mkdir(parents=True, exist_ok=True)
+
+        print(f"* Exporting {len(sources)} {from_format} files to {to_format}...")
+        start = time.perf_counter()
+
+        for destination in export_files(
+            sources,
+            from_format,
+            to_format,
+            self.args.output_dir,
+            self.args.processes,
+        ):
+            print(f"* Wrote {destination.name}")
+
+        print(f"Done in {time.perf_counter() - start:.2f}s ✅")
+
+    def stats(self) -> None:
+        """
+        $ logit stats
+        Total records: {n}
+
+        Level | Count
+        ...
+        """
+
+        if self.args.paths:
+            files = find_scannable_files(self.args.paths)
+        else:
+            files = find_scannable_files(
+                [Path("app.log"), ARCHIVES_FOLDER], text_only=True
+            )
+        stats = scan_files(files, self.args.processes, self.args.use_index)
+        summary = stats.summary(self.args.top)
+
+        if self.args.json:
+            print(json.dumps(summary, indent=2))
+        else:
+            print(format_summary(summary))
+
+    def merge(self) -> None:
+        """
+        $ logit merge app.log
+        [INFO] | worker.py:12 | Started
+        ...
+
+        Structured logs are output as JSON Lines.
+        """
+
+        log_file_path = self.args.log_file_path
+        suffix = log_file_path.suffix[1:]
+        if suffix in tuple(OutputFormat):
+            for log in iter_merged_logs(log_file_path, OutputFormat(suffix)):
+                print(json.dumps(log))
+        else:
+            for line in iter_merged_log_lines(log_file_path):
+                print(line)
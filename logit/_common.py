@@ -19,6 +19,7 @@ APP_DATA_FOLDER = get_path(Path(os.getenv("APPDATA")) / "logit", file=False)
 LOCAL_CONFIG_PATH = get_path(".logit/", file=False)
 CONFIG_FILE = LOCAL_CONFIG_PATH / "config.json"
 ARCHIVES_FOLDER = get_path(LOCAL_CONFIG_PATH / "archives", file=False)
+INDEXES_FOLDER = get_path(LOCAL_CONFIG_PATH / "indexes", file=False)
 
 if not CONFIG_FILE.exists():
     with open(CONFIG_FILE, "w") as f:
@@ -0,0 +1,111 @@
+"""Handles the contextual fields attached to log records.
+
+Context fields are serialized once, when they are bound, so that
+attaching them to a log record costs nothing more than a lookup.
+"""
+
+from __future__ import annotations
+
+import contextvars
+
+from .output import carry_message
+
+
+class Context:
+    """An immutable set of context fields, serialized on creation.
+
+    Example:
+        Context({"request_id": "abc"}).rendered -> "request_id=abc"
+    """
+
+    __slots__ = ("fields", "rendered", "_last_merge")
+
+    def __init__(self, fields: dict[str, str]) -> None:
+        self.fields = fields
+        self.rendered = " ".join(f"{key}={value}" for key, value in fields.items())
+        self._last_merge: tuple[Context, Context] | None = None
+
+    def __bool__(self) -> bool:
+        return bool(self.fields)
+
+    def new_child(self, fields: dict[str, object]) -> Context:
+        """Creates a new context with the given fields layered on top."""
+
+        serialized = {key: carry_message(value) for key, value in fields.items()}
+        return Context({**self.fields, **serialized})
+
+    def merge(self, other: Context) -> Context:
+        """Merges another context on top of this one.
+
+        The last merge is kept, a bound logger logging under the same
+        context variables merges the same pair of contexts every time.
+        """
+
+        if not other:
+            return self
+        if not self:
+            return other
+
+        last_merge = self._last_merge
+        if last_merge is not None and last_merge[0] is other:
+            return last_merge[1]
+        merged = Context({**self.fields, **other.fields})
+        self._last_merge = (other, merged)
+        return merged
+
+
+EMPTY_CONTEXT = Context({})
+
+_context_var: contextvars.ContextVar[Context] = contextvars.ContextVar(
+    "logit_context", default=EMPTY_CONTEXT
+)
+
+
+def get_context() -> Context:
+    """Gets the context bound to the current thread or asyncio task."""
+
+    return _context_var.get()
+
+
+def get_contextvars() -> dict[str, str]:
+    """Gets the context fields bound to the current thread or asyncio task."""
+
+    return dict(_context_var.get().fields)
+
+
+def bind_contextvars(**fields: object) -> contextvars.Token:
+    """Binds context fields to the current thread or asyncio task.
+
+    Arguments:
+        fields: The fields to attach to every following log record.
+
+    Returns:
+        A token that can be passed to `reset_contextvars`.
+
+    Example:
+        bind_contextvars(request_id="abc")
+        log.info("Handled")  # [INFO] | app.py:2 | Handled | request_id=abc
+    """
+
+    return _context_var.set(_context_var.get().new_child(fields))
+
+
+def unbind_contextvars(*keys: str) -> None:
+    """Removes the given context fields from the current thread or asyncio task."""
+
+    fields = _context_var.get().fields
+    _context_var.set(
+        Context({key: value for key, value in fields.items() if key not in keys})
+    )
+
+
+def reset_contextvars(token: contextvars.Token) -> None:
+    """Restores the context to what it was before `bind_contextvars`."""
+
+    _context_var.reset(token)
+
+
+def clear_contextvars() -> None:
+    """Removes all context fields from the current thread or asyncio task."""
+
+    _context_var.set(EMPTY_CONTEXT)
@@ -2,15 +2,32 @@
 
 import csv
 import datetime
+import heapq
 import os
 import json
+import re
 import shutil
+import threading
+import struct
 import time
+import typing as _t
 from functools import lru_cache
 from pathlib import Path
 import xml.etree.ElementTree as ET
 
+from ._buffer import MAX_SIZE as MAX_RING_BUFFER_SIZE
 from ._common import APP_DATA_FOLDER, CONFIG_FILE, LOCAL_CONFIG_PATH, ARCHIVES_FOLDER
+from ._enums import OutputFormat
+
+_CHUNK_SIZE = 1 << 16
+# How far out of order the logs of a shard can be and still be merged in order,
+# which is how far a ring buffer flush can put them
+_MERGE_WINDOW = MAX_RING_BUFFER_SIZE
+BINARY_MAGIC = b"LOGIT\x00\x01\n"
+_BINARY_LENGTH = struct.Struct("<I")
+_BINARY_FIELD = struct.Struct("<HI")
+
+_T = _t.TypeVar("_T")
 
 
 @lru_cache
@@ -75,6 +92,120 @@ def move_log_file(log_file_path: Path) -> None:
     log_file_path.touch()
 
 
+def get_shard_path(file_path: Path) -> Path:
+    """Gets the shard of a log file written to by the current process and thread.
+
+    Example:
+        get_shard_path(Path("app.log")) -> Path("app.4120.4127.log")
+    """
+    file_path = Path(file_path)
+    return file_path.with_name(
+        f"{file_path.stem}.{os.getpid()}.{threading.get_native_id()}{file_path.suffix}"
+    )
+
+
+def find_shards(file_path: Path) -> list[Path]:
+    """Finds all the shards of a log file."""
+    file_path = Path(file_path)
+    shard_name = re.compile(
+        rf"{re.escape(file_path.stem)}\.\d+\.\d+{re.escape(file_path.suffix)}"
+    )
+
+    return sorted(
+        path
+        for path in file_path.parent.glob(f"{file_path.stem}.*{file_path.suffix}")
+        if shard_name.fullmatch(path.name)
+    )
+
+
+def move_log_files(log_file_path: Path) -> None:
+    """Moves the log file, its structural log files and all of
+    their shards into the archives, together."""
+    structural_file_paths = [
+        Path(f"structured-{log_file_path.stem}.{output_format.value}")
+        for output_format in OutputFormat
+    ]
+    for file_path in [log_file_path, *structural_file_paths]:
+        for shard in find_shards(file_path):
+            shutil.move(shard, _create_archive_logfile_name(shard))
+        # Empty files are left in place, structural loggers create theirs upfront
+        if file_path.exists() and file_path.stat().st_size:
+            move_log_file(file_path)
+
+
+def _iter_timed_log_lines(file_path: Path) -> _t.Iterator[tuple[float, str]]:
+    """Streams the lines of a shard along with their time, lines without a time,
+    such as tracebacks, are kept with the line before them."""
+
+    timestamp = 0.0
+    entry = []
+    for lines in iter_text_log_lines(file_path):
+        for line in lines:
+            prefix, _, rest = line.partition(" | ")
+            try:
+                line_timestamp = float(prefix) if rest else None
+            except ValueError:
+                line_timestamp = None
+
+            if line_timestamp is None:
+                entry.append(line)
+                continue
+            if entry:
+                yield timestamp, "\n".join(entry)
+            timestamp, entry = line_timestamp, [rest]
+
+    if entry:
+        yield timestamp, "\n".join(entry)
+
+
+def _iter_windowed_sort(
+    items: _t.Iterable[_T], key: _t.Callable[[_T], float]
+) -> _t.Iterator[_T]:
+    """Streams mostly ordered items in order, as long as none is further
+    than `_MERGE_WINDOW` items away from its place.
+
+    A shard is only mostly ordered, a ring buffer flush writes the logs
+    it held after the logs made since, which are at most its size apart.
+    """
+
+    heap = []
+    for index, item in enumerate(items):
+        heapq.heappush(heap, (key(item), index, item))
+        if len(heap) > _MERGE_WINDOW:
+            yield heapq.heappop(heap)[2]
+    while heap:
+        yield heapq.heappop(heap)[2]
+
+
+def iter_merged_log_lines(log_file_path: Path) -> _t.Iterator[str]:
+    """Streams the lines of all the shards of a log file, ordered by time.
+
+    Every shard is ordered within a window, then they're merged
+    with a heap holding a single line per shard.
+    """
+
+    shards = (
+        _iter_windowed_sort(_iter_timed_log_lines(shard), key=lambda line: line[0])
+        for shard in find_shards(log_file_path)
+    )
+    for _, line in heapq.merge(*shards):
+        yield line
+
+
+def iter_merged_logs(file_path: Path, output_format: OutputFormat) -> _t.Iterator[dict]:
+    """Streams the structural logs of all the shards of a structural log file,
+    ordered by time."""
+
+    def get_timestamp(log: dict) -> float:
+        return float(log["timestamp"])
+
+    shards = (
+        _iter_windowed_sort(iter_logs(shard, output_format), key=get_timestamp)
+        for shard in find_shards(file_path)
+    )
+    return heapq.merge(*shards, key=get_timestamp)
+
+
 def get_json_logs(file_path: Path) -> list:
     """Gets the structural logs in JSON format."""
     try:
@@ -111,3 +242,156 @@ def get_csv_logs(file_path: Path) -> list:
         reader = csv.reader(f)
 
         return list(reader)
+
+
+def iter_text_log_lines(
+    file_path: Path, chunk_size: int = 1 << 22
+) -> _t.Iterator[list[str]]:
+    """Streams the lines of a text log file in chunks of lines.
+
+    Reading a large chunk at a time and splitting it is
+    much faster than reading the file line by line.
+    """
+
+    with open(file_path, "rb") as f:
+        remainder = b""
+        while chunk := f.read(chunk_size):
+            chunk = remainder + chunk
+            end = chunk.rfind(b"\n")
+            if end == -1:
+                remainder = chunk
+                continue
+            remainder = chunk[end + 1 :]
+            yield chunk[:end].decode(errors="replace").split("\n")
+        if remainder:
+            yield [remainder.decode(errors="replace")]
+
+
+def iter_json_logs(file_path: Path) -> _t.Iterator[dict]:
+    """Streams the structural logs in JSON format, without loading
+    the whole file."""
+
+    decoder = json.JSONDecoder()
+    with open(file_path) as f:
+        buffer = f.read(_CHUNK_SIZE).lstrip()
+        if not buffer:
+            return
+        if not buffer.startswith("["):
+            raise ValueError(f"'{file_path}' does not contain a JSON array of logs.")
+
+        index = 1
+        eof = False
+        while True:
+            while index < len(buffer) and buffer[index] in " \t\r\n,":
+                index += 1
+            if index < len(buffer) and buffer[index] == "]":
+                return
+
+            try:
+                log, end = decoder.raw_decode(buffer, index)
+            except json.decoder.JSONDecodeError:
+                end = None
+
+            # A log ending right at the edge of the buffer may be cut short
+            if end is None or (end == len(buffer) and not eof):
+                if eof:
+                    raise ValueError(f"'{file_path}' ends before its JSON array.")
+                chunk = f.read(_CHUNK_SIZE)
+                eof = not chunk
+                buffer = buffer[index:] + chunk
+                index = 0
+                continue
+
+            yield log
+            index = end
+
+
+def iter_xml_logs(file_path: Path) -> _t.Iterator[dict]:
+    """Streams the structural logs in XML format, without loading
+    the whole file."""
+
+    # Structural loggers create their file empty
+    if os.path.getsize(file_path) == 0:
+        return
+
+    root = None
+    for event, element in ET.iterparse(file_path, events=("start", "end")):
+        if root is None:
+            root = element
+        elif event == "end" and element.tag == "log":
+            yield {attr.tag: attr.text for attr in element.iterfind("*")}
+            root.clear()
+
+
+def iter_csv_logs(file_path: Path) -> _t.Iterator[dict]:
+    """Streams the structural logs in CSV format."""
+
+    with open(file_path, newline="") as f:
+        yield from csv.DictReader(f)
+
+
+def iter_jsonl_logs(file_path: Path) -> _t.Iterator[dict]:
+    """Streams the structural logs in JSON Lines format."""
+
+    with open(file_path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def encode_binary_log(log: dict) -> bytes:
+    """Encodes a structural log in the binary format.
+
+    Every log is its length, followed by each field as
+    its key and value lengths, key and value.
+    """
+
+    fields = []
+    for key, value in log.items():
+        key = str(key).encode()
+        value = "" if value is None else str(value)
+        value = value.encode()
+        fields.append(_BINARY_FIELD.pack(len(key), len(value)) + key + value)
+
+    payload = b"".join(fields)
+    return _BINARY_LENGTH.pack(len(payload)) + payload
+
+
+def iter_binary_logs(file_path: Path) -> _t.Iterator[dict]:
+    """Streams the structural logs in binary format."""
+
+    with open(file_path, "rb") as f:
+        magic = f.read(len(BINARY_MAGIC))
+        if not magic:
+            return
+        if magic != BINARY_MAGIC:
+            raise ValueError(f"'{file_path}' is not a binary log file.")
+
+        while header := f.read(_BINARY_LENGTH.size):
+            (length,) = _BINARY_LENGTH.unpack(header)
+            payload = f.read(length)
+            log = {}
+            offset = 0
+            while offset < length:
+                key_length, value_length = _BINARY_FIELD.unpack_from(payload, offset)
+                offset += _BINARY_FIELD.size
+                key = payload[offset : offset + key_length].decode()
+                offset += key_length
+                log[key] = payload[offset : offset + value_length].decode()
+                offset += value_length
+            yield log
+
+
+_LOG_ITERATORS = {
+    OutputFormat.JSON: iter_json_logs,
+    OutputFormat.XML: iter_xml_logs,
+    OutputFormat.CSV: iter_csv_logs,
+    OutputFormat.JSONL: iter_jsonl_logs,
+    OutputFormat.BINARY: iter_binary_logs,
+}
+
+
+def iter_logs(file_path: Path, output_format: OutputFormat) -> _t.Iterator[dict]:
+    """Streams the structural logs of the given format."""
+
+    return _LOG_ITERATORS[output_format](file_path)
@@ -58,3 +58,5 @@ class OutputFormat(StrEnum):
     JSON = auto()
     XML = auto()
     CSV = auto()
+    JSONL = auto()
+    BINARY = auto()
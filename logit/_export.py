@@ -0,0 +1,174 @@
+"""Handles the conversion of structural logs and archives between formats.
+
+Logs are streamed from one format to the other, so memory use does not
+grow with the size of a file, and many files are converted in parallel
+across a process pool.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import csv
+import json
+import os
+import tempfile
+import textwrap
+import typing as _t
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from ._data import BINARY_MAGIC, encode_binary_log, iter_logs
+from ._enums import OutputFormat
+
+
+def _write_json(f: _t.TextIO, logs: _t.Iterable[dict]) -> None:
+    f.write("[")
+    separator = "\n"
+    for log in logs:
+        f.write(separator + textwrap.indent(json.dumps(log, indent=2), "  "))
+        separator = ",\n"
+    f.write("\n]" if separator != "\n" else "]")
+
+
+def _write_xml(f: _t.TextIO, logs: _t.Iterable[dict]) -> None:
+    f.write("<data>")
+    for log in logs:
+        xml_log = ET.Element("log")
+        for key, value in log.items():
+            sub_element = ET.SubElement(xml_log, key)
+            sub_element.text = None if value is None else str(value)
+        f.write(ET.tostring(xml_log, encoding="unicode"))
+    f.write("</data>")
+
+
+def _write_csv(f: _t.TextIO, logs: _t.Iterable[dict], fieldnames: list[str]) -> None:
+    writer = csv.DictWriter(f, fieldnames=fieldnames)
+    writer.writeheader()
+    writer.writerows(logs)
+
+
+def _write_jsonl(f: _t.TextIO, logs: _t.Iterable[dict]) -> None:
+    f.writelines(json.dumps(log) + "\n" for log in logs)
+
+
+def _write_binary(f: _t.BinaryIO, logs: _t.Iterable[dict]) -> None:
+    f.write(BINARY_MAGIC)
+    f.writelines(encode_binary_log(log) for log in logs)
+
+
+def _get_csv_fieldnames(source: Path, from_format: OutputFormat) -> list[str]:
+    """Gets every field used by the logs, in order of appearance.
+
+    CSV needs its header upfront, so the logs are streamed an extra time
+    rather than held in memory.
+    """
+
+    fieldnames = {}
+    for log in iter_logs(source, from_format):
+        fieldnames.update(dict.fromkeys(log))
+
+    return list(fieldnames)
+
+
+def get_export_path(source: Path, to_format: OutputFormat, output_dir: Path) -> Path:
+    """Gets the path a log file is exported to."""
+
+    return output_dir / f"{source.stem}.{to_format.value}"
+
+
+def export_file(
+    source: Path | str,
+    from_format: OutputFormat,
+    to_format: OutputFormat,
+    output_dir: Path | str | None = None,
+) -> Path:
+    """Converts a structural log file to another format.
+
+    The output is written to a temporary file which replaces the
+    destination once complete, so it's never seen half written.
+
+    Arguments:
+        source: The log file to convert.
+        from_format: The format of the log file.
+        to_format: The format to convert to.
+        output_dir: Where to write the output, next to the source by default.
+
+    Returns:
+        The path of the converted file.
+
+    Example:
+        export_file("structured-app.xml", OutputFormat.XML, OutputFormat.JSONL)
+        -> Path("structured-app.jsonl")
+    """
+    source = Path(source)
+    output_dir = source.parent if output_dir is None else Path(output_dir)
+    destination = get_export_path(source, to_format, output_dir)
+
+    binary = to_format == OutputFormat.BINARY
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{destination.name}.", suffix=".tmp", dir=output_dir
+    )
+    try:
+        with open(fd, "wb" if binary else "w", newline=None if binary else "") as f:
+            logs = iter_logs(source, from_format)
+            if to_format == OutputFormat.JSON:
+                _write_json(f, logs)
+            elif to_format == OutputFormat.XML:
+                _write_xml(f, logs)
+            elif to_format == OutputFormat.CSV:
+                _write_csv(f, logs, _get_csv_fieldnames(source, from_format))
+            elif to_format == OutputFormat.JSONL:
+                _write_jsonl(f, logs)
+            elif to_format == OutputFormat.BINARY:
+                _write_binary(f, logs)
+        os.replace(temp_path, destination)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+    return destination
+
+
+def find_log_files(
+    paths: _t.Iterable[Path | str], output_format: OutputFormat
+) -> list[Path]:
+    """Finds the log files of the given format, expanding directories."""
+
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.glob(f"*.{output_format.value}")))
+        else:
+            files.append(path)
+
+    return files
+
+
+def export_files(
+    sources: list[Path],
+    from_format: OutputFormat,
+    to_format: OutputFormat,
+    output_dir: Path | str | None = None,
+    processes: int | None = None,
+) -> _t.Iterator[Path]:
+    """Converts many structural log files to another format in parallel.
+
+    Arguments:
+        processes: The number of processes to convert with,
+        the number of CPUs by default.
+
+    Yields:
+        The path of each converted file, as they complete.
+    """
+    if processes == 1 or len(sources) <= 1:
+        for source in sources:
+            yield export_file(source, from_format, to_format, output_dir)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [
+            executor.submit(export_file, source, from_format, to_format, output_dir)
+            for source in sources
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
@@ -5,6 +5,9 @@ import json
 import os
 import pathlib as _p
 import shutil
+import signal
+import sys
+import threading
 import time
 import typing as _t
 import xml
@@ -12,19 +15,36 @@ import xml.etree.ElementTree as ET
 from xml.etree.ElementTree import Element, ElementTree
 
 from . import _common
+from ._buffer import RingBuffer
+from ._context import EMPTY_CONTEXT, Context, get_context
 from ._data import (
+    BINARY_MAGIC,
+    encode_binary_log,
+    find_shards,
     get_csv_logs,
     get_json_logs,
     get_last_rotation_time,
-    move_log_file,
+    get_shard_path,
+    move_log_files,
     save_last_rotation_time,
 )
 from ._enums import Level, OutputFormat
+from ._record import ExcInfo, LogRecord, get_exc_info
 from ._space import parse_space_data
 from ._time import parse_time_data
-from .output import _output_builder, carry_message, level, line_number, local_time
+from .output import (
+    _format_level,
+    _output_builder,
+    capture_outputs,
+    carry_message,
+    level,
+    line_number,
+)
 from .types_ import LogConfigDict, LogFormatDict
 
+if _t.TYPE_CHECKING:
+    from ._async import AsyncLogger
+
 
 class FormatNotSupported(Exception):
     """Invoked when a particular format is not supported."""
@@ -45,76 +65,129 @@ class StructualLogger:
         )
         self.file_path = _common.get_path(self.file_name)
 
-    def _build_log(self, msg: object) -> dict:
+    def _get_file_path(self) -> _p.Path:
+        """Gets the structural log file to write to, the
+        shard of the current thread when sharded."""
+        if self.logger.sharded:
+            return _common.get_path(get_shard_path(self.file_path))
+        return self.file_path
+
+    def _build_log(self, record: LogRecord) -> dict:
         """Builds the structured log."""
         log = {
-            "msg": carry_message(msg),
-            "level": (level()),
-            "line_number": (line_number(abstraction=7)),
-            "local_time": (local_time()),
+            "msg": carry_message(record.msg),
+            "level": _format_level(record.level.name),
+            "line_number": record.location,
+            "local_time": record.local_time,
         }
-        output_callables = (
-            self.logger.format["msg-prefix"] + self.logger.format["msg-suffix"]
-        )
-        for callable in output_callables:
-            if callable in (local_time, line_number, level):
-                continue
-            log[callable.__name__] = callable()
+        if self.logger.sharded:
+            # Shards are merged by the time of each log
+            log["timestamp"] = f"{record.created:.6f}"
+        if record.exc_info is not None:
+            log["exc_type"] = record.exc_info[0].__qualname__
+            log["exc_message"] = str(record.exc_info[1])
+            log["traceback_id"] = record.fingerprint
+            log["traceback_count"] = str(record.exc_count)
+            # Repeats only reference the traceback by its id
+            log["traceback"] = record.traceback if record.exc_count == 1 else ""
+        for key, value in record.context.fields.items():
+            log.setdefault(key, value)
+        for callable, (output, _) in record.outputs.items():
+            log[callable.__name__] = output
 
         return log
 
-    def output_xml(self, msg: object) -> None:
+    def output_xml(self, records: list[LogRecord]) -> None:
         """Appends output to a structural XML file."""
 
+        file_path = self._get_file_path()
         try:
-            tree = ET.parse(self.file_path)
+            tree = ET.parse(file_path)
         except xml.etree.ElementTree.ParseError:
             data_tag = Element("data")
             tree = ElementTree(data_tag)
 
-        log = self._build_log(msg)
-        xml_log = Element("log")
-        for key, value in log.items():
-            sub_element = Element(key)
-            sub_element.text = value
-            xml_log.append(sub_element)
         root = tree.getroot()
-        root.append(xml_log)
-        tree.write(self.file_path)
-
-    def output_json(self, msg: object) -> None:
+        for record in records:
+            log = self._build_log(record)
+            xml_log = Element("log")
+            for key, value in log.items():
+                sub_element = Element(key)
+                sub_element.text = value
+                xml_log.append(sub_element)
+            root.append(xml_log)
+        tree.write(file_path)
+
+    def output_json(self, records: list[LogRecord]) -> None:
         """Appends output to a structural JSON file."""
 
-        logs = get_json_logs(self.file_path)
-        log = self._build_log(msg)
-        logs.append(log)
-        with open(self.file_path, "w") as f:
+        file_path = self._get_file_path()
+        logs = get_json_logs(file_path)
+        logs.extend(self._build_log(record) for record in records)
+        with open(file_path, "w") as f:
             json.dump(logs, f, indent=2)
 
-    def output_csv(self, msg: object) -> None:
-        """Appends output to a structural CSV file."""
-
-        logs = get_csv_logs(self.file_path)
-        log = self._build_log(msg)
+    def output_csv(self, records: list[LogRecord]) -> None:
+        """Appends output to a structural CSV file.
 
-        if not logs:
-            with open(self.file_path, "w") as f:
-                writer = csv.DictWriter(f, fieldnames=log.keys())
-                writer.writeheader()
-        logs.append(log)
+        When the logs bring new fields, such as context fields,
+        the file is rewritten with them added to the header.
+        """
 
-        with open(self.file_path, "a") as f:
-            writer = csv.DictWriter(f, fieldnames=log.keys())
-            writer.writerows([log])
+        file_path = self._get_file_path()
+        rows = get_csv_logs(file_path)
+        new_logs = [self._build_log(record) for record in records]
+        fieldnames = rows[0] if rows else []
+        new_fieldnames = [
+            key
+            for key in dict.fromkeys(key for log in new_logs for key in log)
+            if key not in fieldnames
+        ]
+
+        if not new_fieldnames:
+            with open(file_path, "a") as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writerows(new_logs)
+            return
 
-    def output(self, msg: object) -> None:
-        """Outputs to relevant format."""
+        logs = [dict(zip(fieldnames, row)) for row in rows[1:]]
+        with open(file_path, "w") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames + new_fieldnames)
+            writer.writeheader()
+            writer.writerows(logs + new_logs)
+
+    def output_jsonl(self, records: list[LogRecord]) -> None:
+        """Appends output to a structural JSON Lines file."""
+
+        file_path = self._get_file_path()
+        with open(file_path, "a") as f:
+            f.writelines(
+                json.dumps(self._build_log(record)) + "\n" for record in records
+            )
+
+    def output_binary(self, records: list[LogRecord]) -> None:
+        """Appends output to a structural binary file."""
+
+        file_path = self._get_file_path()
+        with open(file_path, "ab") as f:
+            if f.tell() == 0:
+                f.write(BINARY_MAGIC)
+            f.writelines(
+                encode_binary_log(self._build_log(record)) for record in records
+            )
+
+    def output(self, records: list[LogRecord]) -> None:
+        """Outputs the records to relevant format."""
         if self.output_format == OutputFormat.JSON:
-            self.output_json(msg)
+            self.output_json(records)
         elif self.output_format == OutputFormat.XML:
-            self.output_xml(msg)
+            self.output_xml(records)
         elif self.output_format == OutputFormat.CSV:
-            self.output_csv(msg)
+            self.output_csv(records)
+        elif self.output_format == OutputFormat.JSONL:
+            self.output_jsonl(records)
+        elif self.output_format == OutputFormat.BINARY:
+            self.output_binary(records)
         else:
             raise FormatNotSupported(f"{self.output_format} is not supported yet.")
 
@@ -133,11 +206,20 @@ class Logger:
         self.log_file_path: _p.Path | str = _p.Path("app.log")
         self.log_rotation_time: int | None = None
         self.log_rotation_space: int | None = None
+        self.sharded = False
         self.format: LogFormatDict = {
             "msg-prefix": [level, line_number],
             "msg-suffix": [],
         }
         self.structural_loggers: set[StructualLogger] = set()
+        self.ring_buffer: RingBuffer | None = None
+        # The times each traceback has been output, and when the
+        # earliest log output with it in full was made
+        self._traceback_counts: dict[str, tuple[int, float]] = {}
+        # Reentrant, as a signal can flush the ring buffer mid output
+        self._output_lock = threading.RLock()
+        self._traceback_lock = threading.RLock()
+        self._crash_hooks_installed = False
         self._rotate_time()
         self._rotate_space()
 
@@ -150,12 +232,73 @@ class Logger:
         self.__level = val
         self.rank = self.__level.get_level_value()
 
-    def _log(self, level: Level, msg: object = "") -> None:
-        if self.rank > level.get_level_value():
-            return
+    def _log(
+        self,
+        level: Level,
+        msg: object = "",
+        context: Context = EMPTY_CONTEXT,
+        exc_info: bool | BaseException | ExcInfo | None = None,
+    ) -> None:
+        records = self._capture(level, msg, context, exc_info)
+        if records:
+            self._output(records)
+
+    def _capture(
+        self,
+        level: Level,
+        msg: object,
+        context: Context,
+        exc_info: bool | BaseException | ExcInfo | None = None,
+    ) -> list[LogRecord]:
+        """Captures the records that have to be output for a log."""
+        rank = level.get_level_value()
+        if self.ring_buffer is None:
+            if self.rank > rank:
+                return []
+            _common.LEVEL = level.name.upper()
+            return [self._make_record(level, msg, context, exc_info)]
+
+        record = self._make_record(level, msg, context, exc_info)
+        self.ring_buffer.append(record)
+        if rank >= self.ring_buffer.flush_rank:
+            # The filtered out records leading up to this one are output
+            # with it, the record itself is among them if it's filtered out too.
+            records = self.ring_buffer.dump(self.rank)
+            if self.rank <= rank:
+                records.append(record)
+        elif self.rank <= rank:
+            records = [record]
+        else:
+            return []
 
         _common.LEVEL = level.name.upper()
-        self._output(msg)
+        return records
+
+    def _make_record(
+        self,
+        level: Level,
+        msg: object,
+        context: Context,
+        exc_info: bool | BaseException | ExcInfo | None = None,
+        depth: int = 4,
+    ) -> LogRecord:
+        """Captures a log record for the caller `depth` frames up the stack.
+
+        Only a reference to the exception is kept, its traceback
+        is rendered when the record is output. The custom format
+        callables are called here, as they report on the time of the log.
+        """
+        frame = sys._getframe(depth)
+        return LogRecord(
+            level,
+            msg,
+            frame.f_code.co_filename,
+            frame.f_lineno,
+            time.time(),
+            get_context().merge(context),
+            get_exc_info(exc_info),
+            capture_outputs(self.format),
+        )
 
     def _rotate_time(self) -> None:
         """Rotates log files based on time duration."""
@@ -165,43 +308,203 @@ class Logger:
         last_rotation_time = get_last_rotation_time(self.log_file_path)
 
         if time.time() - last_rotation_time > self.log_rotation_time:
-            move_log_file(self.log_file_path)
+            move_log_files(self.log_file_path)
+            self._reset_traceback_counts()
             save_last_rotation_time(self.log_file_path)
 
     def _rotate_space(self) -> None:
-        """Rotates log files based on space consumed by log file."""
+        """Rotates log files based on space consumed by log file,
+        along with all of its shards."""
         if self.log_rotation_space is None:
             return
 
-        self.debug("STAGE 2")
-        print(len(self.log_file_path.read_bytes()) * 1000)
-        if len(self.log_file_path.read_bytes()) * 1000 >= self.log_rotation_space:
-            self.debug("STAGE 3")
-            move_log_file(self.log_file_path)
+        log_files = find_shards(self.log_file_path)
+        if self.log_file_path.exists():
+            log_files.append(self.log_file_path)
+        size = sum(log_file.stat().st_size for log_file in log_files)
+
+        if size / 1000 >= self.log_rotation_space:
+            move_log_files(self.log_file_path)
+            self._reset_traceback_counts()
+
+    def _get_log_file_path(self) -> _p.Path:
+        """Gets the log file to write to, the shard of the current thread when sharded."""
+        if self.sharded:
+            return get_shard_path(self.log_file_path)
+        return self.log_file_path
 
     def _create_log_file(self):
         """Creates log file if it doesn't already exist."""
-        if not os.path.exists(self.log_file_path):
-            _p.Path(self.log_file_path).touch()
+        log_file_path = self._get_log_file_path()
+        if not os.path.exists(log_file_path):
+            _p.Path(log_file_path).touch()
 
-    def _output_structural_logs(self, msg: object):
+    def _output_structural_logs(self, records: list[LogRecord]):
         """Run the output of all the structural loggers."""
         for structural_logger in self.structural_loggers:
-            structural_logger.output(msg)
+            structural_logger.output(records)
+
+    def _write_to_log_file(self, outputs: list[str]) -> None:
+        """Writes the outputs to the log file."""
+        with open(self._get_log_file_path(), "a") as f:
+            f.write("\n".join(outputs) + "\n")
+
+    def _count_tracebacks(self, records: list[LogRecord]) -> None:
+        """Counts the times the traceback of each record has been output.
 
-    def _write_to_log_file(self, output: str) -> None:
-        """Writes the output to the log file."""
-        with open(self.log_file_path, "a") as f:
-            f.write(output + "\n")
+        Records aren't always output in the order they're made, such as
+        the ones of a ring buffer flush or of another shard, so a record
+        made before the earliest one holding the full traceback holds it too.
+        """
+        with self._traceback_lock:
+            for record in records:
+                if record.exc_info is None:
+                    continue
+
+                fingerprint = record.fingerprint
+                count, first_created = self._traceback_counts.get(
+                    fingerprint, (0, float("inf"))
+                )
+                count += 1
+                record.exc_count = 1 if record.created < first_created else count
+                self._traceback_counts[fingerprint] = (
+                    count,
+                    min(first_created, record.created),
+                )
+
+    def _reset_traceback_counts(self) -> None:
+        """Forgets the output tracebacks, once the files holding them are archived."""
+        with self._traceback_lock:
+            self._traceback_counts.clear()
+
+    def _output(self, records: list[LogRecord]) -> None:
+        """Prints out the outputs of the records to console and log file.
+
+        Outputs are made one at a time, the structural loggers rewrite
+        their files, so concurrent outputs would lose logs. When sharded,
+        every thread only writes to its own shards, so they aren't.
+        """
+        if self.sharded:
+            self._output_records(records)
+            return
 
-    def _output(self, msg: object) -> None:
-        """Prints out log outputs to console and log file."""
-        output = _output_builder(self.format, msg)
-        self._output_structural_logs(msg)
+        with self._output_lock:
+            self._output_records(records)
+
+    def _output_records(self, records: list[LogRecord]) -> None:
+        """Outputs the records, without waiting on other outputs."""
+        self._count_tracebacks(records)
+        outputs = [_output_builder(self.format, record) for record in records]
+        if self.sharded:
+            # Shards are merged by the time of each record
+            outputs = [
+                f"{record.created:.6f} | {output}"
+                for record, output in zip(records, outputs)
+            ]
+        self._output_structural_logs(records)
         self._create_log_file()
 
-        self._write_to_log_file(output)
-        print(_output_builder(self.format, msg, color=True))
+        self._write_to_log_file(outputs)
+        print(
+            "\n".join(
+                _output_builder(self.format, record, color=True) for record in records
+            )
+        )
+
+    def bind(self, **fields: object) -> BoundLogger:
+        """Creates a child logger that attaches the given fields to every log.
+
+        The fields are serialized once, here, rather than for every log.
+
+        Example:
+            request_log = log.bind(request_id="abc")
+            request_log.info("Handled")  # [INFO] | app.py:2 | Handled | request_id=abc
+        """
+        return BoundLogger(self, EMPTY_CONTEXT.new_child(fields))
+
+    def enable_ring_buffer(
+        self,
+        size: int = 1000,
+        flush_level: Level = Level.ERROR,
+        crash_hooks: bool = True,
+    ) -> None:
+        """Keeps the last `size` logs in memory, including the filtered out ones.
+
+        When a log of `flush_level` or above is made, the filtered out logs
+        leading up to it are output along with it.
+
+        Arguments:
+            size: The number of logs to keep, at most 10,000, so that
+            the flushed logs can still be merged in order when sharded.
+            flush_level: The level of logs that flush the buffer.
+            crash_hooks: Whether to also flush the buffer on unhandled
+            exceptions and termination signals.
+
+        Example:
+            log.config(level=Level.WARNING)
+            log.enable_ring_buffer(size=500)
+            log.debug("Connecting")  # Not output
+            log.error("Connection failed")  # Both logs are output
+        """
+        self.ring_buffer = RingBuffer(size, flush_level)
+        if crash_hooks:
+            self._install_crash_hooks()
+
+    def disable_ring_buffer(self) -> None:
+        """Stops keeping logs in memory, discarding the ones kept."""
+        self.ring_buffer = None
+
+    def flush_ring_buffer(self) -> None:
+        """Outputs the filtered out logs held by the ring buffer."""
+        if self.ring_buffer is None:
+            return
+
+        records = self.ring_buffer.dump(self.rank)
+        if records:
+            self._output(records)
+
+    def _install_crash_hooks(self) -> None:
+        """Flushes the ring buffer on unhandled exceptions and termination signals."""
+        if self._crash_hooks_installed:
+            return
+        self._crash_hooks_installed = True
+
+        previous_excepthook = sys.excepthook
+        previous_threading_excepthook = threading.excepthook
+
+        def excepthook(*args) -> None:
+            self.flush_ring_buffer()
+            previous_excepthook(*args)
+
+        def threading_excepthook(args) -> None:
+            self.flush_ring_buffer()
+            previous_threading_excepthook(args)
+
+        sys.excepthook = excepthook
+        threading.excepthook = threading_excepthook
+
+        # Signal handlers can only be set from the main thread
+        if threading.current_thread() is not threading.main_thread():
+            return
+
+        for signal_name in ("SIGTERM", "SIGHUP"):
+            signum = getattr(signal, signal_name, None)
+            if signum is not None:
+                signal.signal(signum, self._create_signal_handler(signum))
+
+    def _create_signal_handler(self, signum: int) -> _t.Callable:
+        """Creates a signal handler flushing the ring buffer before the previous one."""
+        previous_handler = signal.getsignal(signum)
+
+        def handler(signum: int, frame) -> None:
+            self.flush_ring_buffer()
+            if callable(previous_handler):
+                previous_handler(signum, frame)
+            elif previous_handler != signal.SIG_IGN:
+                signal.signal(signum, signal.SIG_DFL)
+                signal.raise_signal(signum)
+
+        return handler
 
     def add_structural_logger(self, output_format: OutputFormat) -> None:
         self.structural_loggers.add(StructualLogger(output_format, self))
@@ -232,43 +535,128 @@ class Logger:
         log_file_path: _p.Path | str = "app.log",
         rotation_time: None | str = None,
         rotation_space: None | str = None,
+        sharded: bool = False,
     ) -> LogConfigDict:
         """Configurates the logger.
 
         Arguments:
             level: The level of logging.
             log_file_path: The Location of the log file.
+            sharded: Whether every thread and process writes to a shard
+            of the log files of its own, such as `app.<pid>.<tid>.log`.
 
         Returns:
             A dictionary containing the relevant log config
         """
         self.level = level
         self.log_file_path = _p.Path(log_file_path)
+        self.sharded = sharded
         if rotation_time is not None:
             self.log_rotation_time = parse_time_data(rotation_time)
             self._rotate_time()
 
         if rotation_space is not None:
-            self.debug("STAGE 1")
             self.log_rotation_space = parse_space_data(rotation_space)
             self._rotate_space()
 
         return {"level": self.level.value, "log_file_path": str(log_file_path)}
 
-    def clutter(self, msg: object = "") -> None:
-        self._log(Level.CLUTTER, msg)
+    def clutter(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self._log(Level.CLUTTER, msg, exc_info=exc_info)
+
+    def info(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self._log(Level.INFO, msg, exc_info=exc_info)
+
+    def debug(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self._log(Level.DEBUG, msg, exc_info=exc_info)
+
+    def warning(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self._log(Level.WARNING, msg, exc_info=exc_info)
+
+    def error(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self._log(Level.ERROR, msg, exc_info=exc_info)
+
+    def critical(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self._log(Level.CRITICAL, msg, exc_info=exc_info)
+
+    def exception(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = True
+    ) -> None:
+        """Logs an error along with the exception being handled.
 
-    def info(self, msg: object = "") -> None:
-        self._log(Level.INFO, msg)
+        Example:
+            try:
+                connect()
+            except ConnectionError:
+                log.exception("Connection failed")
+        """
+        self._log(Level.ERROR, msg, exc_info=exc_info)
 
-    def debug(self, msg: object = "") -> None:
-        self._log(Level.DEBUG, msg)
 
-    def warning(self, msg: object = "") -> None:
-        self._log(Level.WARNING, msg)
+class BoundLogger:
+    """A lightweight child of a `Logger` carrying precomputed context fields.
 
-    def error(self, msg: object = "") -> None:
-        self._log(Level.ERROR, msg)
+    Shares the configuration, log file and structural loggers of its parent.
 
-    def critical(self, msg: object = "") -> None:
-        self._log(Level.CRITICAL, msg)
+    Example:
+        from logit import log
+        request_log = log.bind(request_id="abc")
+        request_log.info("Handled")  # [INFO] | app.py:3 | Handled | request_id=abc
+    """
+
+    __slots__ = ("logger", "context")
+
+    def __init__(self, logger: Logger | AsyncLogger, context: Context) -> None:
+        self.logger = logger
+        self.context = context
+
+    def bind(self, **fields: object) -> BoundLogger:
+        """Creates a child logger with the given fields added to this one's."""
+        return BoundLogger(self.logger, self.context.new_child(fields))
+
+    def clutter(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self.logger._log(Level.CLUTTER, msg, self.context, exc_info)
+
+    def info(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self.logger._log(Level.INFO, msg, self.context, exc_info)
+
+    def debug(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self.logger._log(Level.DEBUG, msg, self.context, exc_info)
+
+    def warning(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self.logger._log(Level.WARNING, msg, self.context, exc_info)
+
+    def error(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self.logger._log(Level.ERROR, msg, self.context, exc_info)
+
+    def critical(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = None
+    ) -> None:
+        self.logger._log(Level.CRITICAL, msg, self.context, exc_info)
+
+    def exception(
+        self, msg: object = "", exc_info: bool | BaseException | ExcInfo | None = True
+    ) -> None:
+        self.logger._log(Level.ERROR, msg, self.context, exc_info)
@@ -0,0 +1,127 @@
+"""Contains the log record, captured at the time a log is made."""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import os
+import sys
+import traceback
+import types
+import typing as _t
+
+from ._context import Context
+from ._enums import Level
+
+ExcInfo: _t.TypeAlias = tuple[
+    type[BaseException], BaseException, types.TracebackType | None
+]
+
+
+def get_exc_info(exc_info: bool | BaseException | ExcInfo | None) -> ExcInfo | None:
+    """Gets the exception info to attach to a record.
+
+    Arguments:
+        exc_info: True for the exception currently being handled,
+        or the exception itself.
+    """
+
+    if exc_info is None or exc_info is False:
+        return None
+    if exc_info is True:
+        exc_info = sys.exc_info()
+    elif isinstance(exc_info, BaseException):
+        return type(exc_info), exc_info, exc_info.__traceback__
+
+    # sys.exc_info() outside of an except block is (None, None, None)
+    return None if exc_info[0] is None else exc_info
+
+
+class LogRecord:
+    """A log captured at the time of the call.
+
+    Only the raw values are stored, formatting is left to
+    whichever output actually writes the record.
+    """
+
+    __slots__ = (
+        "level",
+        "msg",
+        "filename",
+        "lineno",
+        "created",
+        "context",
+        "exc_info",
+        "exc_count",
+        "outputs",
+        "_fingerprint",
+        "_traceback",
+    )
+
+    def __init__(
+        self,
+        level: Level,
+        msg: object,
+        filename: str,
+        lineno: int,
+        created: float,
+        context: Context,
+        exc_info: ExcInfo | None = None,
+        outputs: dict[_t.Callable[..., str], tuple[str, str]] | None = None,
+    ) -> None:
+        self.level = level
+        self.msg = msg
+        self.filename = filename
+        self.lineno = lineno
+        self.created = created
+        self.context = context
+        self.exc_info = exc_info
+        # How many times the traceback has been output, including this record,
+        # 1 when this record holds it in full
+        self.exc_count = 1
+        # The plain and colored outputs of the custom format callables
+        self.outputs = {} if outputs is None else outputs
+        self._fingerprint: str | None = None
+        self._traceback: str | None = None
+
+    @property
+    def location(self) -> str:
+        """The file name and line number the log was made at."""
+        return f"{os.path.basename(self.filename)}:{self.lineno}"
+
+    @property
+    def local_time(self) -> str:
+        """The local time the log was made at."""
+        created = datetime.datetime.fromtimestamp(self.created)
+        return f"{created.hour}:{created.minute}:{created.second}"
+
+    @property
+    def fingerprint(self) -> str:
+        """Identifies the traceback by the exception type and
+        the code locations of its frames."""
+        if self._fingerprint is None:
+            exc_type, _, tb = self.exc_info
+            locations = [f"{exc_type.__module__}.{exc_type.__qualname__}"]
+            while tb is not None:
+                code = tb.tb_frame.f_code
+                locations.append(f"{code.co_filename}:{code.co_name}:{tb.tb_lineno}")
+                tb = tb.tb_next
+            self._fingerprint = hashlib.blake2b(
+                "\n".join(locations).encode(), digest_size=4
+            ).hexdigest()
+
+        return self._fingerprint
+
+    @property
+    def traceback(self) -> str:
+        """The formatted traceback, rendered the first time it's needed."""
+        if self._traceback is None:
+            self._traceback = "".join(traceback.format_exception(*self.exc_info))
+
+        return self._traceback.rstrip()
+
+    @property
+    def exc_summary(self) -> str:
+        """The exception type and message, such as `ValueError: bad input`."""
+        exc_type, exc, _ = self.exc_info
+        return traceback.format_exception_only(exc_type, exc)[-1].rstrip()
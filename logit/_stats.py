@@ -0,0 +1,352 @@
+"""Handles the analytics of log files and archives.
+
+Every file is scanned in its own process into a partial `LogStats`,
+which are then merged. The stats of a file are saved as an index, so
+unchanged files, such as archives, are only ever scanned once.
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import datetime
+import hashlib
+import itertools
+import json
+import os
+import re
+import typing as _t
+from pathlib import Path
+
+from ._common import INDEXES_FOLDER
+from ._data import find_shards, iter_logs, iter_text_log_lines
+from ._enums import Level, OutputFormat
+
+TEXT_SUFFIXES = (".log", ".txt")
+_STRUCTURAL_CHUNK_SIZE = 10_000
+# Bumped whenever the stats change, so that older indexes are rescanned
+_INDEX_VERSION = 3
+
+_LEVEL_NAMES = frozenset(variant.name for variant in Level)
+_LOCATION = re.compile(r"[^\s|]+:\d+")
+_SHARD_TIMESTAMP = re.compile(r"\d+\.\d{6}")
+_TIME = re.compile(r"(\d{1,2}):(\d{1,2}):\d{1,2}")
+_ARCHIVE_DATE = re.compile(r"(\d{4}-\d{2}-\d{2})-archive-")
+_TEMPLATE_PATTERNS = (
+    (re.compile(r"'[^'\n]*'|\"[^\"\n]*\""), "<str>"),
+    (re.compile(r"\b(?=[0-9a-fA-F-]*\d)[0-9a-fA-F]{8,}(?:-[0-9a-fA-F]+)*\b"), "<id>"),
+    (re.compile(r"\b0x[0-9a-fA-F]+\b|(?<![\w.])-?\d+(?:\.\d+)?"), "<num>"),
+)
+
+
+def get_message_template(msg: str) -> str:
+    """Gets the template of a message, with the variable parts replaced.
+
+    Example:
+        get_message_template("Took 53ms for 'user'") -> "Took <num>ms for <str>"
+    """
+
+    for pattern, placeholder in _TEMPLATE_PATTERNS:
+        msg = pattern.sub(placeholder, msg)
+
+    return msg
+
+
+class LogStats:
+    """The aggregated stats of one or more log files."""
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.levels: collections.Counter[str] = collections.Counter()
+        self.minutes: collections.Counter[str] = collections.Counter()
+        self.call_sites: collections.Counter[str] = collections.Counter()
+        self.templates: collections.Counter[str] = collections.Counter()
+        # Logs with neither a time nor a timestamp, not counted per minute
+        self.untimed = 0
+
+    def add_many(
+        self,
+        levels: list[str],
+        locations: list[str],
+        local_times: list[str],
+        msgs: list[str],
+        date: str = "",
+        timestamps: _t.Sequence[str] = (),
+    ) -> None:
+        """Adds a chunk of logs to the stats.
+
+        Only the fields each log has are in the lists, the minute of a log
+        is taken from its timestamp if it has one, and its local time and
+        the archive `date` otherwise. The raw values are counted first,
+        so that only the distinct ones are parsed.
+        """
+        self.total += len(msgs)
+        self.untimed += len(msgs) - len(local_times) - len(timestamps)
+        for level, count in collections.Counter(levels).items():
+            self.levels[level.strip("[]")] += count
+        self.call_sites.update(locations)
+        for local_time, count in collections.Counter(local_times).items():
+            if match := _TIME.fullmatch(local_time):
+                hour, minute = match.groups()
+                self.minutes[f"{date} {hour:0>2}:{minute:0>2}".lstrip()] += count
+            else:
+                self.untimed += count
+        epoch_minutes = collections.Counter(
+            int(float(timestamp)) // 60 for timestamp in timestamps
+        )
+        for epoch_minute, count in epoch_minutes.items():
+            minute = datetime.datetime.fromtimestamp(epoch_minute * 60)
+            self.minutes[minute.strftime("%Y-%m-%d %H:%M")] += count
+
+        # Templating every message of the chunk at once is
+        # much cheaper than templating them one at a time.
+        templates = get_message_template("\n".join(msgs)).split("\n")
+        self.templates.update(templates)
+        self.templates.pop("", None)
+
+    def merge(self, other: LogStats) -> LogStats:
+        """Merges the stats of another file into these."""
+        self.total += other.total
+        self.levels.update(other.levels)
+        self.minutes.update(other.minutes)
+        self.call_sites.update(other.call_sites)
+        self.templates.update(other.templates)
+        self.untimed += other.untimed
+
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "levels": dict(self.levels),
+            "minutes": dict(self.minutes),
+            "call_sites": dict(self.call_sites),
+            "templates": dict(self.templates),
+            "untimed": self.untimed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> LogStats:
+        stats = cls()
+        stats.total = data["total"]
+        stats.levels.update(data["levels"])
+        stats.minutes.update(data["minutes"])
+        stats.call_sites.update(data["call_sites"])
+        stats.templates.update(data["templates"])
+        stats.untimed = data["untimed"]
+
+        return stats
+
+    def summary(self, top: int = 10) -> dict:
+        """Summarizes the stats, keeping only the `top` entries of each."""
+        per_minute = self.minutes.values()
+        return {
+            "total": self.total,
+            "levels": {
+                variant.name: self.levels[variant.name]
+                for variant in Level
+                if variant.name in self.levels
+            },
+            "records_per_minute": {
+                "average": sum(per_minute) / len(per_minute) if per_minute else 0,
+                "peak": dict(self.minutes.most_common(top)),
+                "untimed": self.untimed,
+            },
+            "call_sites": dict(self.call_sites.most_common(top)),
+            "templates": dict(self.templates.most_common(top)),
+        }
+
+
+def _scan_text_log(file_path: Path, stats: LogStats, date: str) -> None:
+    """Scans a text log, written in any order of the default callables."""
+
+    for lines in iter_text_log_lines(file_path):
+        levels, locations, local_times, timestamps, msgs = [], [], [], [], []
+        for line in lines:
+            level = location = local_time = msg = None
+            parts = line.split(" | ")
+            if len(parts) == 1:
+                # Not a log, such as a line of a traceback
+                continue
+            if _SHARD_TIMESTAMP.fullmatch(parts[0]):
+                # The timestamp of a shard is used over the local time
+                local_time = ""
+                timestamps.append(parts.pop(0))
+            for part in parts:
+                if (
+                    level is None
+                    and part[:1] == "["
+                    and part[-1:] == "]"
+                    and part[1:-1] in _LEVEL_NAMES
+                ):
+                    level = part
+                    levels.append(part)
+                # A time would also pass for a location, so it's tested first
+                elif local_time is None and _TIME.fullmatch(part):
+                    local_time = part
+                    local_times.append(part)
+                elif location is None and _LOCATION.fullmatch(part):
+                    location = part
+                    locations.append(part)
+                elif msg is None:
+                    msg = part
+            msgs.append(msg or "")
+        stats.add_many(levels, locations, local_times, msgs, date, timestamps)
+
+
+def _scan_structural_log(
+    file_path: Path, output_format: OutputFormat, stats: LogStats, date: str
+) -> None:
+    logs = iter_logs(file_path, output_format)
+    while chunk := list(itertools.islice(logs, _STRUCTURAL_CHUNK_SIZE)):
+        stats.add_many(
+            [log["level"] for log in chunk if log.get("level")],
+            [log["line_number"] for log in chunk if log.get("line_number")],
+            [
+                log["local_time"]
+                for log in chunk
+                if log.get("local_time") and not log.get("timestamp")
+            ],
+            [(log.get("msg") or "").replace("\n", " ") for log in chunk],
+            date,
+            [log["timestamp"] for log in chunk if log.get("timestamp")],
+        )
+
+
+def _get_index_path(file_path: Path) -> Path:
+    """Gets the path of the index of a log file."""
+
+    digest = hashlib.sha1(str(file_path.absolute()).encode()).hexdigest()[:16]
+    return INDEXES_FOLDER / f"{file_path.name}.{digest}.json"
+
+
+def scan_file(file_path: Path | str, use_index: bool = True) -> LogStats:
+    """Gets the stats of a single log file.
+
+    Arguments:
+        file_path: The text or structural log file to scan.
+        use_index: Whether to reuse the saved stats of the file
+        if it hasn't changed since, and save them otherwise.
+    """
+    file_path = Path(file_path)
+    stat = file_path.stat()
+    index_path = _get_index_path(file_path)
+
+    if use_index and index_path.exists():
+        with open(index_path) as f:
+            index = json.load(f)
+        if (
+            index.get("version") == _INDEX_VERSION
+            and index["size"] == stat.st_size
+            and index["mtime_ns"] == stat.st_mtime_ns
+        ):
+            return LogStats.from_dict(index["stats"])
+
+    stats = LogStats()
+    match = _ARCHIVE_DATE.match(file_path.name)
+    date = match.group(1) if match else ""
+    if file_path.suffix in TEXT_SUFFIXES:
+        _scan_text_log(file_path, stats, date)
+    else:
+        output_format = OutputFormat(file_path.suffix[1:])
+        _scan_structural_log(file_path, output_format, stats, date)
+
+    if use_index:
+        index = {
+            "version": _INDEX_VERSION,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "stats": stats.to_dict(),
+        }
+        temp_path = index_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "w") as f:
+            json.dump(index, f)
+        os.replace(temp_path, index_path)
+
+    return stats
+
+
+def find_scannable_files(
+    paths: _t.Iterable[Path | str], text_only: bool = False
+) -> list[Path]:
+    """Finds the text and structural log files, expanding directories,
+    and log files to their shards.
+
+    Arguments:
+        text_only: Whether to only find the text log files. Every log is
+        in the text log, so its structural logs and their exports would
+        count it again.
+    """
+
+    suffixes = TEXT_SUFFIXES
+    if not text_only:
+        suffixes += tuple(f".{variant.value}" for variant in OutputFormat)
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(
+                sorted(file for file in path.iterdir() if file.suffix in suffixes)
+            )
+            continue
+        if path.exists():
+            files.append(path)
+        files.extend(find_shards(path))
+
+    return files
+
+
+def scan_files(
+    files: list[Path], processes: int | None = None, use_index: bool = True
+) -> LogStats:
+    """Gets the merged stats of many log files, scanning them in parallel.
+
+    Arguments:
+        processes: The number of processes to scan with,
+        the number of CPUs by default.
+    """
+    stats = LogStats()
+    if processes == 1 or len(files) <= 1:
+        for file in files:
+            stats.merge(scan_file(file, use_index))
+        return stats
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+        for partial_stats in executor.map(scan_file, files, [use_index] * len(files)):
+            stats.merge(partial_stats)
+
+    return stats
+
+
+def format_summary(summary: dict) -> str:
+    """Formats a stats summary as tables."""
+
+    lines = [f"Total records: {summary['total']}", ""]
+    per_minute = summary["records_per_minute"]
+    sections = (
+        ("Level", summary["levels"]),
+        ("Minute", per_minute["peak"]),
+        ("Call site", summary["call_sites"]),
+        ("Message template", summary["templates"]),
+    )
+    for title, counts in sections:
+        width = max((len(key) for key in counts), default=0)
+        width = max(width, len(title))
+        lines.append(f"{title:<{width}} | Count")
+        lines.append(f"{'-' * width}-|------")
+        lines.extend(f"{key:<{width}} | {count}" for key, count in counts.items())
+        if title == "Minute":
+            lines.append(f"{'Average':<{width}} | {per_minute['average']:.1f}")
+        lines.append("")
+
+    if per_minute["untimed"]:
+        lines.append(
+            f"Note: {per_minute['untimed']} records have no time, such as text logs"
+            " written without `local_time`, and aren't counted per minute."
+        )
+    if any(len(minute) == len("00:00") for minute in per_minute["peak"]):
+        lines.append(
+            "Note: minutes without a date come from unsharded logs"
+            " that weren't archived yet, and may combine several days."
+        )
+
+    return "\n".join(lines)
@@ -1,12 +1,19 @@
+from __future__ import annotations
+
 import datetime
+import functools
 import inspect
 import os
+import typing as _t
 
 import colorama
 
 from . import _common
 from .types_ import LogFormatCallable, LogFormatDict
 
+if _t.TYPE_CHECKING:
+    from ._record import LogRecord
+
 _LEVEL_COLORS = {
     "CLUTTER": "",
     "INFO": colorama.Fore.CYAN,
@@ -42,30 +49,81 @@ def line_number(abstraction: int = 6, color: bool = False) -> str:
     return f"{filename}:{line_number}"
 
 
-def level(color: bool = False) -> str:
-    """Returns the current level of logging."""
+def _format_level(level_name: str, color: bool = False) -> str:
+    """Formats the name of a level."""
 
     if color:
-        level = _get_colored_str(_common.LEVEL, _LEVEL_COLORS[_common.LEVEL])
+        level = _get_colored_str(level_name, _LEVEL_COLORS[level_name])
         level = f"[{level}]"
     else:
-        level = f"[{_common.LEVEL}]"
+        level = f"[{level_name}]"
 
     return level
 
 
+def level(color: bool = False) -> str:
+    """Returns the current level of logging."""
+
+    return _format_level(_common.LEVEL, color)
+
+
+@functools.lru_cache
+def _accepts_color(callable: LogFormatCallable) -> bool:
+    """Whether the callable can output in color."""
+
+    return "color" in inspect.getfullargspec(callable).args
+
+
+def capture_outputs(format: LogFormatDict) -> dict[LogFormatCallable, tuple[str, str]]:
+    """Calls the custom callables of the format at the time of a log,
+    giving their plain and colored outputs."""
+
+    outputs = {}
+    for callable in format["msg-prefix"] + format["msg-suffix"]:
+        if callable in (level, line_number, local_time):
+            continue
+        plain = callable()
+        colored = callable(color=True) if _accepts_color(callable) else plain
+        outputs[callable] = (plain, colored)
+
+    return outputs
+
+
+def _record_output(callable: LogFormatCallable, record: LogRecord, color: bool) -> str:
+    """Gets the output of the callable for the given record.
+
+    The builtin callables are answered from the values captured
+    in the record, as are the custom ones, which were called
+    at the time of the log rather than at the time of output.
+    """
+
+    if callable is level:
+        return _format_level(record.level.name, color)
+    if callable is line_number:
+        if color:
+            return _get_colored_str(record.location, colorama.Fore.LIGHTCYAN_EX)
+        return record.location
+    if callable is local_time:
+        return record.local_time
+    if callable in record.outputs:
+        return record.outputs[callable][color]
+    if color and _accepts_color(callable):
+        return callable(color=True)
+
+    return callable()
+
+
 def _merge_output(
-    output: str, format_: str, callables: list[LogFormatCallable], color: bool
+    output: str,
+    format_: str,
+    callables: list[LogFormatCallable],
+    record: LogRecord,
+    color: bool,
 ) -> str:
     """Merges the output for the given callable."""
 
     for callable in callables:
-        if color and "color" in inspect.getfullargspec(callable).args:
-            s = format_.format(output=callable(color=True))
-        else:
-            s = format_.format(output=callable())
-
-        output += s
+        output += format_.format(output=_record_output(callable, record, color))
 
     return output
 
@@ -79,12 +137,34 @@ def carry_message(msg: object) -> str:
     return str(msg)
 
 
-def _output_builder(format: LogFormatDict, msg: object, color: bool = False) -> str:
-    """Builds the output from the given format."""
+def _exception_output(record: LogRecord) -> str:
+    """Builds the output of the exception of a record.
+
+    The full traceback is only output the first time it's seen,
+    repeats only reference it by its fingerprint.
+    """
+
+    if record.exc_count == 1:
+        return f" | traceback={record.fingerprint}\n{record.traceback}"
+
+    return (
+        f" | traceback={record.fingerprint} (seen {record.exc_count} times)"
+        f" | {record.exc_summary}"
+    )
+
+
+def _output_builder(
+    format: LogFormatDict, record: LogRecord, color: bool = False
+) -> str:
+    """Builds the output of a record from the given format."""
 
     output = ""
-    output = _merge_output(output, "{output} | ", format["msg-prefix"], color)
-    output += carry_message(msg)
-    output = _merge_output(output, " | {output}", format["msg-suffix"], color)
+    output = _merge_output(output, "{output} | ", format["msg-prefix"], record, color)
+    output += carry_message(record.msg)
+    if record.context:
+        output += f" | {record.context.rendered}"
+    output = _merge_output(output, " | {output}", format["msg-suffix"], record, color)
+    if record.exc_info is not None:
+        output += _exception_output(record)
 
     return output